@@ -96,8 +96,9 @@ class TxtFile(DataProcessor):
             self._check_file_size(file_path)
             with open(file_path, "r", encoding="utf-8") as file:
                 if self.remove_logger_prefix_from_raw_data:
+                    logger_prefix_regex = re.compile(self.logger_prefix)
                     for line in file:
-                        match = re.search(self.logger_prefix, line)
+                        match = logger_prefix_regex.search(line)
                         extracted_part = line[match.end() :]
                         extracted_part = extracted_part.lstrip().rstrip()
                         raw_data.append(extracted_part)
@@ -212,8 +213,9 @@ class TxtFile(DataProcessor):
         raw_section_data = []
         current_section = []
         initial = True
+        regex = re.compile(regex)
         for line in raw_data:
-            if re.search(regex, line):
+            if regex.search(line):
                 if not initial:
                     raw_section_data.append(current_section)
                 initial = False
@@ -242,11 +244,12 @@ class TxtFile(DataProcessor):
         """
         raw_section_data = []
         current_section = []
+        regex = re.compile(regex)
 
         for line in raw_data:
             current_section.append(line)
 
-            if re.search(regex, line):
+            if regex.search(line):
                 raw_section_data.append(current_section)
                 current_section = []
 
@@ -275,10 +278,12 @@ class TxtFile(DataProcessor):
         """
         raw_section_data = []
         current_section = []
+        regex_start = re.compile(regex_start)
+        regex_end = re.compile(regex_end)
         for line in raw_data:
-            if re.search(regex_start, line):
+            if regex_start.search(line):
                 current_section = [line]
-            elif current_section and re.search(regex_end, line):
+            elif current_section and regex_end.search(line):
                 current_section.append(line)
                 raw_section_data.append(current_section)
                 current_section = []
@@ -302,11 +307,12 @@ class TxtFile(DataProcessor):
                                 (line number, line content).
         """
         matches = []
+        regex = re.compile(regex)
 
         # Iterate over each line in the section
         for line_number, line in enumerate(section, start=1):
             # Check if the line matches the specified regex
-            if re.search(regex, line):
+            if regex.search(line):
                 # Add the line to the result dictionary with adjusted line number
                 matches.append((line_number, line))
 
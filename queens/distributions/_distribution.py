@@ -80,7 +80,7 @@ class Distribution(abc.ABC):
             parameters (dict): Checked parameters
         """
         for name, value in parameters.items():
-            if (np.array(value) <= 0).any():
+            if (np.asarray(value) <= 0).any():
                 raise ValueError(
                     f"The parameter '{name}' has to be positive. " f"You specified {name}={value}."
                 )
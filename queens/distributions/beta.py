@@ -14,27 +14,62 @@
 #
 """Beta Distribution."""
 
+import math
+
 import numpy as np
-import scipy.linalg
-import scipy.stats
+import scipy.special
+from numba import njit
 
 from queens.distributions._distribution import Continuous
 from queens.utils.logger_settings import log_init_args
 
 
+@njit
+def beta_logpdf_scalar(x, a, b, lower_bound, width, logpdf_const):
+    """Jitted log pdf of a generalized beta distribution at a single position.
+
+    Intended for scalar evaluations inside jitted code, e.g., in hand-written samplers, where the
+    overhead of the vectorized *Beta.logpdf* would dominate.
+
+    Args:
+        x (float): Position at which the log pdf is evaluated
+        a (float): Shape parameter *a* of the beta distribution
+        b (float): Shape parameter *b* of the beta distribution
+        lower_bound (float): Lower bound of the beta distribution
+        width (float): Width of the beta distribution
+        logpdf_const (float): Constant of the log pdf, see *Beta.logpdf_const*
+
+    Returns:
+        logpdf (float): log pdf at the evaluated position
+    """
+    y = (x - lower_bound) / width
+    if y < 0.0 or y > 1.0:
+        return -np.inf
+    logpdf = logpdf_const
+    if a != 1.0:
+        logpdf += (a - 1.0) * math.log(y) if y > 0.0 else -np.sign(a - 1.0) * np.inf
+    if b != 1.0:
+        logpdf += (b - 1.0) * math.log1p(-y) if y < 1.0 else -np.sign(b - 1.0) * np.inf
+    return logpdf
+
+
 class Beta(Continuous):
     """Beta distribution.
 
-    A generalized one-dimensional beta distribution based on scipy stats. The generalized beta
-    distribution has a lower bound and an upper bound.
+    A generalized one-dimensional beta distribution. The generalized beta distribution has a
+    lower bound and an upper bound.
     The parameters *a* and *b* determine the shape of the distribution within these bounds.
+    The density, cdf and ppf are evaluated directly via the special functions in scipy.special
+    to avoid the overhead of the generic scipy.stats machinery. Single precision positions are
+    evaluated in single precision, the moments of the distribution are always double precision.
 
     Attributes:
         lower_bound (np.ndarray): Lower bound of the beta distribution.
         upper_bound (np.ndarray): Upper bound of the beta distribution.
+        width (np.ndarray): Width of the beta distribution.
         a (float): Shape parameter of the beta distribution, must be greater than 0.
         b (float): Shape parameter of the beta distribution, must be greater than 0.
-        scipy_beta (scipy.stats.beta): Scipy beta distribution object.
+        logpdf_const (np.ndarray): Constant for the evaluation of the log pdf.
     """
 
     @log_init_args
@@ -53,16 +88,17 @@ class Beta(Continuous):
         b = np.array(b)
         super().check_positivity(a=a, b=b)
         super().check_bounds(lower_bound, upper_bound)
-        scale = upper_bound - lower_bound
-        scipy_beta = scipy.stats.beta(scale=scale, loc=lower_bound, a=a, b=b)
-        mean = scipy_beta.mean()
-        covariance = scipy_beta.var()
+        width = upper_bound - lower_bound
+        mean = lower_bound + width * a / (a + b)
+        covariance = width**2 * a * b / ((a + b) ** 2 * (a + b + 1.0))
+        logpdf_const = -scipy.special.betaln(a, b) - np.log(width)
 
         self.lower_bound = lower_bound
         self.upper_bound = upper_bound
+        self.width = width
         self.a = a
         self.b = b
-        self.scipy_beta = scipy_beta
+        self.logpdf_const = logpdf_const
 
         super().__init__(mean=mean, covariance=covariance, dimension=1)
 
@@ -75,7 +111,8 @@ class Beta(Continuous):
         Returns:
             cdf (np.ndarray): CDF at evaluated positions
         """
-        cdf = self.scipy_beta.cdf(x).reshape(-1)
+        y = np.clip(self._standardize(x), 0.0, 1.0)
+        cdf = scipy.special.betainc(self.a.astype(y.dtype), self.b.astype(y.dtype), y)
         return cdf
 
     def draw(self, num_draws=1):
@@ -87,7 +124,9 @@ class Beta(Continuous):
         Returns:
             samples (np.ndarray): drawn samples from the distribution
         """
-        samples = self.scipy_beta.rvs(size=num_draws).reshape(-1, 1)
+        samples = self.lower_bound + self.width * np.random.beta(
+            self.a, self.b, size=(num_draws, 1)
+        )
         return samples
 
     def logpdf(self, x):
@@ -99,7 +138,12 @@ class Beta(Continuous):
         Returns:
             logpdf (np.ndarray): log pdf at evaluated positions
         """
-        logpdf = self.scipy_beta.logpdf(x).reshape(-1)
+        y = self._standardize(x)
+        # accumulate in place to avoid temporaries for large position arrays
+        logpdf = scipy.special.xlogy((self.a - 1.0).astype(y.dtype), y)
+        logpdf += scipy.special.xlog1py((self.b - 1.0).astype(y.dtype), -y)
+        logpdf += self.logpdf_const
+        logpdf[(y < 0.0) | (y > 1.0)] = -np.inf
         return logpdf
 
     def grad_logpdf(self, x):
@@ -121,7 +165,7 @@ class Beta(Continuous):
         Returns:
             pdf (np.ndarray): Pdf at evaluated positions
         """
-        pdf = self.scipy_beta.pdf(x).reshape(-1)
+        pdf = np.exp(self.logpdf(x))
         return pdf
 
     def ppf(self, quantiles):
@@ -133,5 +177,55 @@ class Beta(Continuous):
         Returns:
             ppf (np.ndarray): Positions which correspond to given quantiles
         """
-        ppf = self.scipy_beta.ppf(quantiles).reshape(-1)
+        # the inversion of the incomplete beta function is iterative, hence evaluate recurring
+        # quantiles (e.g. grids of standard uniform points) only once
+        unique_quantiles, inverse_indices = np.unique(
+            np.asarray(quantiles).reshape(-1), return_inverse=True
+        )
+        standard_ppf = scipy.special.betaincinv(self.a, self.b, unique_quantiles)
+        ppf = self.lower_bound + self.width * standard_ppf[inverse_indices.reshape(-1)]
         return ppf
+
+    @staticmethod
+    def batch_logpdf(x, lower_bound, upper_bound, a, b):
+        """Log pdf of several beta distributions in a single vectorized evaluation.
+
+        All arguments are broadcast against each other, such that e.g. the log pdfs of a batch
+        of independent beta priors can be evaluated without creating and looping over one
+        distribution object per prior.
+
+        Args:
+            x (np.ndarray): Positions at which the log pdfs are evaluated
+            lower_bound (np.ndarray): Lower bounds of the beta distributions
+            upper_bound (np.ndarray): Upper bounds of the beta distributions
+            a (np.ndarray): Shape parameters *a* of the beta distributions
+            b (np.ndarray): Shape parameters *b* of the beta distributions
+
+        Returns:
+            logpdf (np.ndarray): log pdfs at evaluated positions
+        """
+        width = np.asarray(upper_bound) - lower_bound
+        y = (np.asarray(x) - lower_bound) / width
+        logpdf = (
+            scipy.special.xlogy(np.subtract(a, 1.0), y)
+            + scipy.special.xlog1py(np.subtract(b, 1.0), -y)
+            - scipy.special.betaln(a, b)
+            - np.log(width)
+        )
+        logpdf = np.where((y < 0.0) | (y > 1.0), -np.inf, logpdf)
+        return logpdf
+
+    def _standardize(self, x):
+        """Map positions onto the standard support [0, 1].
+
+        Args:
+            x (np.ndarray): Positions on the support of the distribution
+
+        Returns:
+            y (np.ndarray): Positions mapped onto the standard support
+        """
+        x = np.asarray(x).reshape(-1)
+        # keep single precision inputs in single precision to halve the memory traffic
+        dtype = np.result_type(x, np.float32)
+        y = (x - self.lower_bound.astype(dtype)) / self.width.astype(dtype)
+        return y
@@ -231,7 +231,7 @@ class Jobscript(Driver):
             inject_in_template(
                 job_options.add_data_and_to_dict(self.jobscript_options),
                 self.jobscript_template,
-                str(jobscript_file),
+                jobscript_file,
             )
 
         with metadata.time_code("run_jobscript"):
@@ -263,17 +263,17 @@ class Jobscript(Driver):
         output_dir = job_dir / "output"
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        output_prefix = experiment_name + "_" + str(job_id)
+        output_prefix = f"{experiment_name}_{job_id}"
         output_file = output_dir / output_prefix
 
         input_files = {}
         for input_template_name, input_template_path in self.input_templates.items():
             input_file_str = (
-                f"{experiment_name}_{input_template_name}_{job_id}" + input_template_path.suffix
+                f"{experiment_name}_{input_template_name}_{job_id}{input_template_path.suffix}"
             )
             input_files[input_template_name] = job_dir / input_file_str
 
-        log_file = output_dir / (output_prefix + ".log")
+        log_file = output_dir / f"{output_prefix}.log"
 
         return job_dir, output_dir, output_file, input_files, log_file
 
@@ -26,6 +26,9 @@ import numpy as np
 from queens.external_geometries._external_geometry import ExternalGeometry
 from queens.utils.logger_settings import log_init_args
 
+# regex for the sections of the dat-file
+_SECTION_NAME_REGEX = re.compile("^-+([^-].+)$")
+
 
 class FourcDat(ExternalGeometry):
     """Class to read in external geometries based on 4C dat files.
@@ -221,9 +224,7 @@ class FourcDat(ExternalGeometry):
         Returns:
             bool (boolean): True or False depending if current line is the section match
         """
-        # regex for the sections
-        section_name_re = re.compile("^-+([^-].+)$")
-        match = section_name_re.match(line)
+        match = _SECTION_NAME_REGEX.match(line)
         # get the current section of the dat file
         if match:
             # remove whitespaces and horizontal line
@@ -158,7 +158,7 @@ class VariationalInference(Iterator):
 
     def core_run(self):
         """Core run for stochastic variational inference."""
-        start = time.time()
+        start = time.perf_counter()
 
         self.iteration_data.add(variational_parameters=self.variational_params)
         old_parameters = self.variational_params.copy()
@@ -181,7 +181,7 @@ class VariationalInference(Iterator):
             self.iteration_data.add(variational_parameters=self.variational_params)
             old_parameters = self.variational_params.copy()
 
-        end = time.time()
+        end = time.perf_counter()
 
         if self.n_sims > self.max_feval:
             _logger.warning("Maximum probabilistic model calls reached")
@@ -313,7 +313,7 @@ class Optimization(Iterator):
     def core_run(self):
         """Core run of Optimization iterator."""
         _logger.info("Welcome to Optimization core run.")
-        start = time.time()
+        start = time.perf_counter()
 
         # minimization with bounds using Jacobian
         if self.algorithm in {"L-BFGS-B", "TNC"}:
@@ -364,7 +364,7 @@ class Optimization(Iterator):
                 jac=self.jacobian,
                 options={"disp": self.verbose_output},
             )
-        end = time.time()
+        end = time.perf_counter()
         _logger.info("Optimization took %E seconds.", end - start)
 
     def post_run(self):
@@ -81,9 +81,9 @@ class Points(Iterator):
 
     def core_run(self):
         """Run model."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         self.output = self.model.evaluate(self.points_array)
-        end_time = time.time()
+        end_time = time.perf_counter()
         _logger.info("Model runs done, took %f seconds", end_time - start_time)
 
     def post_run(self):
@@ -188,10 +188,10 @@ class ReinforcementLearning(Iterator):
         _logger.info("Welcome to Reinforcement Learning core run.")
         if self.mode == "training":
             _logger.info("Starting agent training.")
-            start = time.time()
+            start = time.perf_counter()
             # Start the model training
             self.model.train()
-            end = time.time()
+            end = time.perf_counter()
             _logger.info("Agent training took %E seconds.", end - start)
         else:  # self._mode == "evaluation"
             _logger.info("Starting interaction loop.")
@@ -209,7 +209,7 @@ class ReinforcementLearning(Iterator):
             else:  # initial observation has been provided by the user
                 _logger.debug("Using provided initial observation.")
                 obs = self.initial_observation
-            start = time.time()
+            start = time.perf_counter()
             # Perform as many interaction steps as set by the user
             for _ in range(self._interaction_steps):
                 result = self.model.interact(obs)
@@ -217,7 +217,7 @@ class ReinforcementLearning(Iterator):
                 obs = result["new_obs"]
                 # Update the samples and outputs
                 self.update_samples_and_outputs(obs, result)
-            end = time.time()
+            end = time.perf_counter()
             _logger.info("Interaction loop took %E seconds.", end - start)
             # convert the generated samples and outputs to numpy arrays
             self.convert_to_numpy()
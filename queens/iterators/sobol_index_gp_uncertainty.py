@@ -172,7 +172,7 @@ class SobolIndexGPUncertainty(Iterator):
         Uncertainty Quantification 2, no. 1 (1 January 2014): 336–63.
         https://doi.org/10.1137/130926869.
         """
-        start_run = time.time()
+        start_run = time.perf_counter()
 
         # 1. Generate Monte-Carlo samples
         samples = self.sampler.sample()
@@ -184,7 +184,7 @@ class SobolIndexGPUncertainty(Iterator):
         # 4. Evaluate statistics
         self.evaluate_statistics(estimates)
 
-        _logger.info("Time for full calculation: %s", time.time() - start_run)
+        _logger.info("Time for full calculation: %s", time.perf_counter() - start_run)
 
     def evaluate_statistics(self, estimates):
         """Evaluate statistics of Sobol index estimates.
@@ -153,7 +153,7 @@ class SobolIndexEstimator:
             # adapt index so that for second-order indices redundant indices are not calculated
             # twice since S_ij == S_ji
             cross_parameter_names.remove(parameter_name)
-            start_time = time.time()
+            start_time = time.perf_counter()
 
             # calculate estimates in parallel (either over realizations or bootstrapping samples)
             estimate_function, input_list = self._setup_parallelization(
@@ -164,7 +164,9 @@ class SobolIndexEstimator:
             # sort raw output from parallel processes
             self._sort_output(raw_output, parameter_name, cross_parameter_names)
 
-            _logger.info("Time for parameter %s: %f", parameter_name, time.time() - start_time)
+            _logger.info(
+                "Time for parameter %s: %f", parameter_name, time.perf_counter() - start_time
+            )
 
         pool.close()
 
@@ -487,7 +489,7 @@ class SobolIndexEstimatorThirdOrder(SobolIndexEstimator):
         """
         bootstrap_idx = self._draw_bootstrap_index()
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         # calculate estimates in parallel over Gaussian process realizations
         estimate_function, input_list = self._setup_parallelization(prediction, 0, bootstrap_idx)
 
@@ -499,7 +501,7 @@ class SobolIndexEstimatorThirdOrder(SobolIndexEstimator):
         # sort raw output from parallel processes
         self._sort_output(raw_output, "", [])
 
-        _logger.info("Time for third-order indices: %f", time.time() - start_time)
+        _logger.info("Time for third-order indices: %f", time.perf_counter() - start_time)
 
         estimates = {
             "first_order": None,
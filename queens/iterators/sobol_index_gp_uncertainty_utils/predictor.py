@@ -86,7 +86,7 @@ class Predictor:
         Returns:
             prediction (xr.Array): predictions
         """
-        start_prediction = time.time()
+        start_prediction = time.perf_counter()
 
         prediction = self._init_prediction(samples)
 
@@ -106,7 +106,7 @@ class Predictor:
 
         prediction.data = np.array(raw_prediction)
 
-        _logger.info("Time for prediction: %f", time.time() - start_prediction)
+        _logger.info("Time for prediction: %f", time.perf_counter() - start_prediction)
         _logger.debug("Prediction %s", prediction.values)
         return prediction
 
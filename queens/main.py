@@ -38,7 +38,7 @@ def run(input_file, output_dir, debug=False):
         output_dir (Path): Path object to the output directory
         debug (bool): True if debug mode is to be used
     """
-    start_time_input = time.time()
+    start_time_input = time.perf_counter()
 
     # read input and create config
     config = load_input_file(input_file)
@@ -64,7 +64,7 @@ def run(input_file, output_dir, debug=False):
         # Create iterator
         my_iterator = from_config_create_iterator(config, global_settings)
 
-        end_time_input = time.time()
+        end_time_input = time.perf_counter()
 
         _logger.info("")
         _logger.info("Time for INPUT: %s s", end_time_input - start_time_input)
@@ -84,7 +84,7 @@ def run_iterator(iterator, global_settings):
     """
     global_settings.print_git_information()
 
-    start_time_calc = time.time()
+    start_time_calc = time.perf_counter()
 
     _logger.info(
         "%s for experiment: %s", iterator.__class__.__name__, global_settings.experiment_name
@@ -101,7 +101,7 @@ def run_iterator(iterator, global_settings):
         # TODO: Write iterator in pickle file # pylint: disable=fixme
         raise exception
 
-    end_time_calc = time.time()
+    end_time_calc = time.perf_counter()
     _logger.info("")
     _logger.info("Time for CALCULATION: %s s", end_time_calc - start_time_calc)
     _logger.info("")
@@ -16,11 +16,10 @@
 
 # pylint: disable=invalid-name
 import logging
+import math
 
 import numpy as np
-import scipy.stats as st
-from sklearn.preprocessing import StandardScaler
-from tqdm import tqdm
+from numba import get_num_threads, njit, prange
 
 import queens.utils.pdf_estimation as est
 from queens.iterators.data import Data
@@ -30,6 +29,10 @@ from queens.utils.logger_settings import log_init_args
 
 _logger = logging.getLogger(__name__)
 
+# number of Monte-Carlo points whose densities are evaluated at once on the support
+_MC_CHUNK_SIZE = 4096
+_BANDWIDTH_MAX_NUM_SAMPLES = 10000
+
 
 class BMFMC(Model):
     r"""Bayesian multi-fidelity Monte-Carlo model.
@@ -101,6 +104,9 @@ class BMFMC(Model):
                             :math:`Z=\left[y_{LF,i}(X),\Gamma\right]`.
         Z_mc (np.array): Monte-Carlo matrix of low-fidelity features according to
                          :math:`Z^*=\left[y_{LF,i}(X^*),\Gamma^*\right]`.
+        Z_ext_mc (np.array): Monte-Carlo matrix of LF outputs and all extended informative
+                             features :math:`\left[y_{LF,i}(X^*),\Gamma_{ext}^*\right]`, of
+                             which *Z_mc* is a view for `opt_features`.
         m_f_mc (np.array): Vector of posterior mean values of multi-fidelity mapping
                            corresponding to the Monte-Carlo input *Z_mc* according to
                            :math:`\mathrm{m}_{f^*}(Z^*)`.
@@ -233,6 +239,7 @@ class BMFMC(Model):
         self.gammas_ext_train = None
         self.Z_train = None
         self.Z_mc = None
+        self.Z_ext_mc = None
         self.m_f_mc = None
         self.var_y_mc = None
         self.p_yhf_mean = None
@@ -412,25 +419,18 @@ class BMFMC(Model):
         # here we load the random parameter description from the pickle file
         # we load the description of the uncertain parameters from the first lf iterator
         # (note: all lf iterators have the same description)
-        self.uncertain_parameters = (
-            self.lf_data_iterators[0].read_pickle_file().get("input_description")
-        )
+        lf_data = self.lf_data_iterators[0].read_pickle_file()
+        self.uncertain_parameters = lf_data.get("input_description")
 
         # --------------------- load LF sampling raw data with data iterators --------------
-        self.X_mc = self.lf_data_iterators[0].read_pickle_file().get("input_data")
+        self.X_mc = lf_data.get("input_data")
         # here we assume that all lfs have the same input vector
-        try:
-            self.eigenfunc_random_fields = (
-                self.lf_data_iterators[0].read_pickle_file().get("eigenfunc")
-            )
-            self.eigenvals = self.lf_data_iterators[0].read_pickle_file().get("eigenvalue")
-        except IOError:
-            self.eigenfunc_random_fields = None
-            self.eigenvals = None
+        self.eigenfunc_random_fields = lf_data.get("eigenfunc")
+        self.eigenvals = lf_data.get("eigenvalue")
 
-        Y_LFs_mc = [
+        Y_LFs_mc = [lf_data.get("output")[:, 0]] + [
             lf_data_iterator.read_pickle_file().get("output")[:, 0]
-            for lf_data_iterator in self.lf_data_iterators
+            for lf_data_iterator in self.lf_data_iterators[1:]
         ]
 
         self.Y_LFs_mc = np.atleast_2d(np.vstack(Y_LFs_mc)).T
@@ -478,14 +478,9 @@ class BMFMC(Model):
             )
         elif (self.Y_HF_mc is not None) and (self.high_fidelity_model is None):
             # match Y_HF_mc data with X_train do determine Y_HF_train
-            index_rows = [
-                np.where(np.all(self.X_mc == self.X_train[i, :], axis=1))[0][0]
-                for i, _ in enumerate(self.X_train[:, 0])
-            ]
+            index_rows = match_rows(self.X_train, self.X_mc)
 
-            self.Y_HF_train = np.atleast_2d(
-                np.asarray([self.Y_HF_mc[index] for index in index_rows])
-            ).T
+            self.Y_HF_train = self.Y_HF_mc[index_rows][:, np.newaxis]
         else:
             raise RuntimeError(
                 "Please make sure to provide either a pickle file with "
@@ -531,65 +526,63 @@ class BMFMC(Model):
 
     def calculate_p_yhf_mean(self):
         """Calculate the posterior mean estimate for the HF density."""
-        standard_deviation = np.sqrt(self.var_y_mc)
-        pdf_mat = st.norm.pdf(self.y_pdf_support, loc=self.m_f_mc, scale=standard_deviation)
-        pyhf_mean_vec = np.sum(pdf_mat, axis=0)
-        self.p_yhf_mean = 1 / self.m_f_mc.size * pyhf_mean_vec
+        inv_standard_deviation = 1 / np.sqrt(self.var_y_mc)
+
+        # sum the normal densities of the Monte-Carlo points in chunks to bound the memory
+        pyhf_mean_vec = 0
+        for start in range(0, len(self.m_f_mc), _MC_CHUNK_SIZE):
+            chunk = slice(start, start + _MC_CHUNK_SIZE)
+            standardized_support = (
+                self.y_pdf_support - self.m_f_mc[chunk]
+            ) * inv_standard_deviation[chunk]
+            pyhf_mean_vec = pyhf_mean_vec + np.sum(
+                inv_standard_deviation[chunk] * np.exp(-0.5 * standardized_support**2), axis=0
+            )
+        self.p_yhf_mean = 1 / (np.sqrt(2 * np.pi) * self.m_f_mc.size) * pyhf_mean_vec
 
     def calculate_p_yhf_var(self):
-        """Calculate the posterior variance of the HF density prediction."""
-        # calculate full posterior covariance matrix for testing points
-        _, k_post = self.interface.evaluate(self.Z_mc.T)
-
-        spacing = 1
-        f_mean_pred = self.m_f_mc[0::spacing, :]
-        yhf_var_pred = self.var_y_mc[0::spacing, :]
-        k_post = k_post[0::spacing, 0::spacing]
-
-        # Define support structure for computation
-        points = np.vstack((self.y_pdf_support, self.y_pdf_support)).T
-
-        # Define the outer loop (addition of all multivariate normal distributions
-        yhf_pdf_grid = np.zeros((points.shape[0],))
-        i = 1
-        _logger.info("\n")
-
-        # TODO we should speed this up with multiprocessing # pylint: disable=fixme
-        for num1, (mean1, var1) in enumerate(
-            zip(tqdm(f_mean_pred, desc=r"Calculating Var_f[p(y_HF|f,z,D)]"), yhf_var_pred)
-        ):
-            for num2, (mean2, var2) in enumerate(
-                zip(f_mean_pred[num1 + 1 :], yhf_var_pred[num1 + 1 :])
-            ):
-                num2 = num1 + num2
-                covariance = k_post[num1, num2]
-                mean_vec = np.array([mean1, mean2])
-                diff = points - mean_vec.T
-                det_sigma = var1 * var2 - covariance**2
+        """Calculate the posterior variance of the HF density prediction.
 
-                if det_sigma < 0:
-                    det_sigma = 1e-6
-                    covariance = 0.95 * covariance
-
-                inv_sigma = (
-                    1
-                    / det_sigma
-                    * np.array(
-                        [np.append(var2, -covariance), np.insert(var1, 0, -covariance)],
-                        dtype=np.float64,
-                    )
-                )
+        The posterior mean *m_f_mc* and the posterior variance *var_y_mc* of the Monte-Carlo
+        points are reused from the prediction in *run_BMFMC*. The covariances between the points
+        are taken from the full posterior covariance matrix of the latent function *f*, for which
+        the probabilistic mapping is evaluated once more. As the noise is independent, its
+        off-diagonal entries coincide with the ones of *y*.
+        """
+        # calculate full posterior covariance matrix of the latent function for testing points
+        _, k_post = self.interface.evaluate(self.Z_mc.T, support="f", full_cov=True)
+
+        # posterior mean and variance (not the covariance) of the testing points
+        f_mean_pred = np.ascontiguousarray(np.ravel(self.m_f_mc), dtype=np.float64)
+        yhf_var_pred = np.ascontiguousarray(np.ravel(self.var_y_mc), dtype=np.float64)
+        num_points = f_mean_pred.size
+        k_post = np.asarray(k_post, dtype=np.float64)
+        if k_post.shape != (num_points, num_points):
+            raise ValueError(
+                f"The posterior covariance matrix of the {num_points} Monte-Carlo points must have "
+                f"shape {(num_points, num_points)}, but the probabilistic mapping returned shape "
+                f"{k_post.shape}! Abort..."
+            )
 
-                a = np.dot(diff, inv_sigma)
-                b = np.einsum("ij,ij->i", a, diff)
-                c = np.sqrt(4 * np.pi**2 * det_sigma)
-                args = -0.5 * b + np.log(1 / c)
-                args[args > 40] = 40  # limit arguments for for better conditioning
-                yhf_pdf_grid += np.exp(args)
-                i = i + 1
+        num_pairs = num_points * (num_points - 1) // 2
+        if num_pairs == 0:
+            _logger.warning(
+                "Var_f[p(y_HF|f,z,D)] requires at least two Monte-Carlo points. Skipping..."
+            )
+            return
+
+        # add up the bivariate normal distributions of all pairs of points on the support
+        _logger.info("Calculating Var_f[p(y_HF|f,z,D)]...")
+        yhf_pdf_grid = accumulate_pair_pdfs(
+            f_mean_pred,
+            yhf_var_pred,
+            k_post,
+            np.asarray(self.y_pdf_support, dtype=np.float64),
+            get_num_threads(),
+        )
 
-                # Define inner loop (add rows of 2D domain to yield variance function)
-                self.p_yhf_var = 1 / (i - 1) * yhf_pdf_grid - 0.9995 * self.p_yhf_mean**2
+        # average over all pairs of points to yield the variance function
+        self.p_yhf_var = 1 / num_pairs * yhf_pdf_grid - 0.9995 * self.p_yhf_mean**2
 
     def compute_pymc_reference(self):
         """Compute reference kernel density estimate.
@@ -598,9 +591,17 @@ class BMFMC(Model):
         reference kernel density estimate for the quantity of interest
         and optimize the bandwidth of the kde.
         """
-        # optimize the bandwidth for the kde
+        # optimize the bandwidth for the kde (on a fixed subsample for large LF MC datasets, as the
+        # cross-validation scales with the number of samples)
+        y_lf_mc = self.Y_LFs_mc[:, 0]
+        bandwidth_samples = y_lf_mc
+        if y_lf_mc.size > _BANDWIDTH_MAX_NUM_SAMPLES:
+            rng = np.random.default_rng(0)
+            bandwidth_samples = y_lf_mc[
+                rng.choice(y_lf_mc.size, _BANDWIDTH_MAX_NUM_SAMPLES, replace=False)
+            ]
         bandwidth_lfmc = est.estimate_bandwidth_for_kde(
-            self.Y_LFs_mc[:, 0], np.amin(self.Y_LFs_mc[:, 0]), np.amax(self.Y_LFs_mc[:, 0])
+            bandwidth_samples, np.amin(y_lf_mc), np.amax(y_lf_mc)
         )
 
         if self.Y_HF_mc is not None:
@@ -609,6 +610,7 @@ class BMFMC(Model):
                 np.atleast_2d(self.Y_HF_mc),
                 bandwidth_lfmc,
                 support_points=np.atleast_2d(self.y_pdf_support),
+                use_fft=True,
             )
 
         if self.Y_LFs_train.shape[1] < 2:
@@ -616,6 +618,7 @@ class BMFMC(Model):
                 np.atleast_2d(self.Y_LFs_mc).T,
                 bandwidth_lfmc,
                 support_points=np.atleast_2d(self.y_pdf_support),
+                use_fft=True,
             )  # TODO: make this also work for several lfs # pylint: disable=fixme
 
     def set_feature_strategy(self):
@@ -627,8 +630,8 @@ class BMFMC(Model):
         """
         if self.features_config == "man_features":
             idx_vec = self.X_cols
-            self.gammas_ext_train = np.atleast_2d(self.X_train[:, idx_vec]).T
-            self.gammas_ext_mc = np.atleast_2d(self.X_mc[:, idx_vec]).T
+            self.gammas_ext_train = self.X_train[:, idx_vec].reshape(self.X_train.shape[0], -1)
+            self.gammas_ext_mc = self.X_mc[:, idx_vec].reshape(self.X_mc.shape[0], -1)
             self.Z_train = np.hstack([self.Y_LFs_train, self.gammas_ext_train])
             self.Z_mc = np.hstack([self.Y_LFs_mc, self.gammas_ext_mc])
         elif self.features_config == "opt_features":
@@ -658,38 +661,28 @@ class BMFMC(Model):
         :math:`\boldsymbol{\gamma_{LF}}`.
         """
         x_red = self.input_dim_red()  # this is also standardized
-        x_iter_test = x_red
-        self.gammas_ext_mc = np.empty((x_iter_test.shape[0], 0))
 
         # standardize the LF output vector for better performance
-        Y_LFS_mc_stdized = StandardScaler().fit_transform(self.Y_LFs_mc)
+        Y_LFS_mc_stdized = standardize_columns(self.Y_LFs_mc)
 
-        # Iteratively sort reduced input space by importance of its dimensions
-        for counter in range(x_red.shape[1]):
-            # calculate the scores/ranking of candidates for informative input features gamma_i
-            # by projecting the (dim. reduced) input on the LFs output
-            corr_coef_unnorm = np.abs(np.dot(x_iter_test.T, Y_LFS_mc_stdized))
+        # calculate the scores/ranking of candidates for informative input features gamma_i
+        # by projecting the (dim. reduced) input on the LFs output
+        corr_coef_unnorm = np.abs(np.dot(x_red.T, Y_LFS_mc_stdized))
 
-            # --------- plot the rankings/scores for first iteration -------------------------------
-            if self.visualization:
-                if counter == 0:
-                    ele = np.arange(1, x_iter_test.shape[1] + 1)
-                    self.visualization.plot_feature_ranking(ele, corr_coef_unnorm, counter)
-            # --------------------------------------------------------------------------------------
+        # --------- plot the rankings/scores -------------------------------------------------------
+        if self.visualization:
+            ele = np.arange(1, x_red.shape[1] + 1)
+            self.visualization.plot_feature_ranking(ele, corr_coef_unnorm, 0)
+        # ------------------------------------------------------------------------------------------
 
-            # select input feature with the highest score
-            select_bool = corr_coef_unnorm == np.max(corr_coef_unnorm)
-            test_iter = np.dot(x_iter_test, select_bool)
+        # Sort reduced input space by importance of its dimensions. The score of a dimension does
+        # not depend on the remaining candidates, so a single ranking is sufficient.
+        ranking = np.argsort(-np.max(corr_coef_unnorm, axis=1), kind="stable")
 
-            # substract last choice from candidate pool
-            x_iter_test = np.atleast_2d(x_iter_test[:, ~select_bool[:, 0]])
-
-            # Scale features linearly to LF output data so that probabilistic model
-            # can be fit easier
-            features_test = linear_scale_a_to_b(test_iter, self.Y_LFs_mc)
-
-            # Assemble feature vectors and informative features
-            self.gammas_ext_mc = np.hstack((self.gammas_ext_mc, features_test))
+        # Scale features linearly to LF output data so that probabilistic model
+        # can be fit easier
+        self.gammas_ext_mc = linear_scale_a_to_b(x_red[:, ranking], self.Y_LFs_mc)
+        self.Z_ext_mc = None
 
     def update_probabilistic_mapping_with_features(self):
         r"""Update probabilistic mapping.
@@ -702,9 +695,11 @@ class BMFMC(Model):
         determination of optimal training points is outsourced to the
         BMFMC iterator and the results get only called at this place.
         """
-        # Select demanded number of features
-        gamma_mc = self.gammas_ext_mc[:, 0 : self.num_features]
-        self.Z_mc = np.hstack([self.Y_LFs_mc, gamma_mc])
+        # Assemble the LF outputs and all extended features only once and select the demanded
+        # number of features as a view
+        if self.Z_ext_mc is None:
+            self.Z_ext_mc = np.hstack([self.Y_LFs_mc, self.gammas_ext_mc])
+        self.Z_mc = self.Z_ext_mc[:, 0 : self.Y_LFs_mc.shape[1] + self.num_features]
 
         # Get training data from training_indices previously calculated in the iterator
         if self.training_indices is not None:
@@ -774,45 +769,131 @@ class BMFMC(Model):
         # iterate over all random fields
         dim_random_fields = 0
         if self.parameters.random_field_flag:
-            for random_field, basis, eigenvals in zip(
+            random_fields_trunc_dict = {}
+            for (random_field_name, random_field), basis, eigenvals in zip(
                 random_fields_list,
-                self.eigenfunc_random_fields.items(),
-                self.eigenvals.items(),
+                self.eigenfunc_random_fields.values(),
+                self.eigenvals.values(),
             ):
-                # write the simulated samples of the random fields also in the new dictionary
+                # determine the truncation basis, the explained variance of the eigenvalues is
+                # cumulated and hence sorted in ascending order
+                idx_truncation = int(np.searchsorted(eigenvals, explained_var, side="left"))
+
+                # write the simulated samples of the random fields and their truncated basis in
+                # the new dictionary
                 # Attention: Here we assume that X_mc contains in the first columns uncorrelated
                 #            random variables until the column id 'num_random_var' and then only
                 #            random fields
-                random_fields_trunc_dict = {
-                    random_field[0]: {
-                        "samples": self.X_mc[
-                            :,
-                            num_random_var
-                            + dim_random_fields : num_random_var
-                            + dim_random_fields
-                            + random_field[1].dimension,
-                        ]
-                    }
+                first_column = num_random_var + dim_random_fields
+                random_fields_trunc_dict[random_field_name] = {
+                    "samples": self.X_mc[:, first_column : first_column + random_field.dimension],
+                    "trunc_basis": basis[0:idx_truncation],
                 }
 
-                # determine the truncation basis
-                idx_truncation = [
-                    idx for idx, eigenval in enumerate(eigenvals[1]) if eigenval >= explained_var
-                ][0]
-
-                # write the truncated basis also in the dictionary
-                random_fields_trunc_dict[random_field[0]].update(
-                    {"trunc_basis": basis[1][0:idx_truncation]}
-                )
-
                 # adjust the counter for next iteration
-                dim_random_fields += random_field[1].dimension
+                dim_random_fields += random_field.dimension
         else:
             random_fields_trunc_dict = None
 
         return x_uncorr, random_fields_trunc_dict
 
 
+@njit(parallel=True, cache=True)
+def accumulate_pair_pdfs(f_mean, var, k_post, y_support, num_threads):
+    r"""Sum the bivariate normal densities of all pairs of points on the support diagonal.
+
+    For every pair of points :math:`i<j`, the bivariate normal density with means
+    :math:`(m_i, m_j)`, variances :math:`(v_i, v_j)` and the covariance taken from *k_post* is
+    evaluated at :math:`y_1=y_2=y` for all *y* in *y_support*. Pairs are distributed over the
+    threads in an interleaved way, each thread accumulating into its own row.
+
+    Args:
+        f_mean (np.array): Posterior mean values of the points
+        var (np.array): Posterior variances of the points
+        k_post (np.array): Posterior covariance matrix of the points, the shape is not checked
+        y_support (np.array): Support grid
+        num_threads (int): Number of threads the pairs are distributed over
+
+    Returns:
+        pdf_grid (np.array): Sum of the pair densities on the support grid
+    """
+    num_points = f_mean.size
+    num_support = y_support.size
+    pdf_grids = np.zeros((num_threads, num_support))
+
+    # pylint: disable=not-an-iterable
+    for thread in prange(num_threads):
+        # pylint: enable=not-an-iterable
+        pdf_grid = pdf_grids[thread]
+        for num1 in range(thread, num_points - 1, num_threads):
+            mean1 = f_mean[num1]
+            var1 = var[num1]
+            for num2 in range(num1 + 1, num_points):
+                mean2 = f_mean[num2]
+                var2 = var[num2]
+                covariance = k_post[num1, num2]
+                det_sigma = var1 * var2 - covariance**2
+                if det_sigma < 0:
+                    det_sigma = 1e-6
+                    covariance = 0.95 * covariance
+
+                # coefficients of the exponent, i.e. of -0.5 * diff^T inv(sigma) diff
+                coeff11 = -0.5 * var2 / det_sigma
+                coeff12 = covariance / det_sigma
+                coeff22 = -0.5 * var1 / det_sigma
+                log_normalization = -0.5 * math.log(4 * math.pi**2 * det_sigma)
+                for k in range(num_support):
+                    diff1 = y_support[k] - mean1
+                    diff2 = y_support[k] - mean2
+                    args = (
+                        coeff11 * diff1 * diff1
+                        + coeff12 * diff1 * diff2
+                        + coeff22 * diff2 * diff2
+                        + log_normalization
+                    )
+                    # limit arguments for better conditioning
+                    pdf_grid[k] += math.exp(min(args, 40.0))
+
+    return pdf_grids.sum(axis=0)
+
+
+def match_rows(rows, reference_rows):
+    """Find the indices of rows in a reference array.
+
+    The rows are compared via their raw bytes, which allows for a hashed lookup instead of
+    comparing every row with the entire reference array.
+
+    Args:
+        rows (np.array): Rows to look up
+        reference_rows (np.array): Reference array containing all of the rows
+
+    Returns:
+        indices (np.array): Index of the first matching reference row for every row
+
+    Raises:
+        ValueError: If a row is not contained in the reference array
+    """
+    dtype = reference_rows.dtype
+    row_dtype = np.dtype((np.void, dtype.itemsize * reference_rows.shape[1]))
+
+    # adding zero maps -0.0 to 0.0 such that both are considered equal as for ==
+    reference_keys = np.ascontiguousarray(reference_rows + 0).view(row_dtype).ravel().tolist()
+    keys = np.ascontiguousarray(np.asarray(rows, dtype=dtype) + 0).view(row_dtype).ravel().tolist()
+
+    # iterate backwards such that the first occurrence of duplicate rows is kept
+    num_reference_rows = len(reference_keys)
+    reference_indices = dict(zip(reversed(reference_keys), range(num_reference_rows - 1, -1, -1)))
+    indices = []
+    for num, key in enumerate(keys):
+        if key not in reference_indices:
+            raise ValueError(
+                f"The training row {num} with values {rows[num]} could not be found in the "
+                "Monte-Carlo data! Abort..."
+            )
+        indices.append(reference_indices[key])
+    return np.array(indices, dtype=int)
+
+
 def project_samples_on_truncated_basis(truncated_basis_dict, num_samples):
     """Project samples on truncated basis.
 
@@ -828,11 +909,15 @@ def project_samples_on_truncated_basis(truncated_basis_dict, num_samples):
         coefs_mat (np.array): Matrix containing the reduced representation of all random fields
                               stacked together along the columns.
     """
-    coefs_mat = np.empty((num_samples, 0))
+    num_coefs = sum(basis["trunc_basis"].shape[0] for basis in truncated_basis_dict.values())
+    coefs_mat = np.empty((num_samples, num_coefs))
 
-    # iterate over random fields
-    for basis in truncated_basis_dict.items():
-        coefs_mat = np.hstack((coefs_mat, np.dot(basis[1]["samples"], basis[1]["trunc_basis"].T)))
+    # iterate over random fields and write their coefficients next to each other
+    start = 0
+    for basis in truncated_basis_dict.values():
+        stop = start + basis["trunc_basis"].shape[0]
+        coefs_mat[:, start:stop] = np.dot(basis["samples"], basis["trunc_basis"].T)
+        start = stop
 
     return coefs_mat
 
@@ -841,23 +926,45 @@ def linear_scale_a_to_b(data_a, data_b):
     """Scale linearly.
 
     Scale a data vector 'data_a' linearly to the range of data vector
-    'data_b'.
+    'data_b'. If 'data_a' is a matrix, each of its columns is scaled
+    separately.
 
     Args:
-        data_a (np.array): Data vector that should be scaled.
+        data_a (np.array): Data vector or matrix that should be scaled.
         data_b (np.array): Reference data vector that provides the range for scaling.
 
     Returns:
-       scaled_a (np.array): Scaled data_a vector.
+       scaled_a (np.array): Scaled data_a vector or matrix.
     """
     min_b = np.min(data_b)
     max_b = np.max(data_b)
-    scaled_a = min_b + (data_a - np.min(data_a)) * (
-        (max_b - min_b) / (np.max(data_a) - np.min(data_a))
-    )
+    min_a = np.min(data_a, axis=0)
+    max_a = np.max(data_a, axis=0)
+    scaled_a = (data_a - min_a) * ((max_b - min_b) / (max_a - min_a))
+    scaled_a += min_b
     return scaled_a
 
 
+def standardize_columns(data, out=None):
+    """Standardize the columns of a data matrix.
+
+    Columns are shifted to zero mean and scaled to unit variance. Columns with zero variance are
+    only shifted.
+
+    Args:
+        data (np.array): Data matrix with samples along the rows
+        out (np.array, optional): Array the result is written to, which may be *data* itself
+
+    Returns:
+        data_stdizd (np.array): Standardized data matrix
+    """
+    std = np.std(data, axis=0)
+    std[std == 0.0] = 1.0
+    data_stdizd = np.subtract(data, np.mean(data, axis=0), out=out)
+    data_stdizd /= std
+    return data_stdizd
+
+
 def assemble_x_red_stdizd(x_uncorr, coef_mat):
     """Assemble and standardize the dimension-reduced input x_red.
 
@@ -868,11 +975,15 @@ def assemble_x_red_stdizd(x_uncorr, coef_mat):
     Returns:
         X_red_test_stdizd (np.array): Standardized dimension-reduced input.
     """
-    if coef_mat is not None:
-        x_red = np.hstack((x_uncorr, coef_mat))
-    else:
-        x_red = x_uncorr
-    X_red_test_stdizd = StandardScaler().fit_transform(x_red)
+    if coef_mat is None:
+        return standardize_columns(x_uncorr)
+
+    # assemble both blocks in one array and standardize it in place
+    num_uncorr = x_uncorr.shape[1]
+    X_red_test_stdizd = np.empty((x_uncorr.shape[0], num_uncorr + coef_mat.shape[1]))
+    X_red_test_stdizd[:, :num_uncorr] = x_uncorr
+    X_red_test_stdizd[:, num_uncorr:] = coef_mat
+    standardize_columns(X_red_test_stdizd, out=X_red_test_stdizd)
     return X_red_test_stdizd
 
 
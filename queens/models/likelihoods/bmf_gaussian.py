@@ -1095,7 +1095,7 @@ class BmfiaInterface:
 
     def _train_probabilistic_mappings_serial(self):
         """Train the probabilistic models in series."""
-        t_s = time.time()
+        t_s = time.perf_counter()
 
         num_map = len(self.probabilistic_mapping_obj_lst)
         for num, probabilistic_model in enumerate(self.probabilistic_mapping_obj_lst):
@@ -1107,7 +1107,7 @@ class BmfiaInterface:
                 num_map,
             )
 
-        t_e = time.time()
+        t_e = time.perf_counter()
         t_total = t_e - t_s
         _logger.info("Total time for training of all probabilistic mappings: %d s", t_total)
 
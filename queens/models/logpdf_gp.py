@@ -296,7 +296,7 @@ class LogpdfGP(Model):
         initial_samples_unconstrained = np.log(initial_samples)
         loss(initial_samples_unconstrained[0])
         jax.grad(loss)(initial_samples_unconstrained[0])
-        start = time.time()
+        start = time.perf_counter()
         positions = np.zeros((self.num_optimizations, self.num_dim + 2))
         objectives = np.zeros(self.num_optimizations)
         for i in range(self.num_optimizations):
@@ -305,7 +305,7 @@ class LogpdfGP(Model):
             )
             positions[i] = result["x"]
             objectives[i] = result["fun"]
-        _logger.info("Optimization Time: %f s", time.time() - start)
+        _logger.info("Optimization Time: %f s", time.perf_counter() - start)
         _logger.info("Optimized Loss Value: %f", np.nanmin(np.array(objectives)))
         _logger.info(
             "Number of failed optimizations: %i / %i",
@@ -350,9 +350,9 @@ class LogpdfGP(Model):
                 seed=sample_key,
             )
 
-        start = time.time()
+        start = time.perf_counter()
         hyperparameter_samples = run_chain_fn(np.log(initial_hyperparameters))
-        _logger.info("Sampling Time: %f s", time.time() - start)
+        _logger.info("Sampling Time: %f s", time.perf_counter() - start)
         hyperparameter_samples = np.exp(hyperparameter_samples)
         return hyperparameter_samples
 
@@ -239,13 +239,31 @@ class Surrogate(Model):
         Returns:
             dict: Dictionary with error measures and corresponding error values
         """
+        # the residual and its square or absolute value are computed once for all measures
+        residual = y_test - y_posterior_mean
+        squared_residual = residual**2
+        abs_residual = np.abs(residual)
+
+        error_functions = {
+            "sum_squared": lambda: np.sum(squared_residual),
+            "mean_squared": lambda: np.mean(squared_residual),
+            "root_mean_squared": lambda: np.sqrt(np.mean(squared_residual)),
+            "sum_abs": lambda: np.sum(abs_residual),
+            "mean_abs": lambda: np.mean(abs_residual),
+            "abs_max": lambda: np.max(abs_residual),
+            "nash_sutcliffe_efficiency": lambda: Surrogate.compute_nash_sutcliffe_efficiency(
+                y_test, y_posterior_mean
+            ),
+        }
+
         error_measures = {}
         for measure in measures:
-            error_measures[measure] = self.compute_error(y_test, y_posterior_mean, measure)
+            if measure not in error_functions:
+                raise NotImplementedError(f"Desired error measure '{measure}' is unknown!")
+            error_measures[measure] = error_functions[measure]()
         return error_measures
 
-    @staticmethod
-    def compute_error(y_test, y_posterior_mean, measure):
+    def compute_error(self, y_test, y_posterior_mean, measure):
         """Compute error for given a specific error measure.
 
         Args:
@@ -256,17 +274,7 @@ class Surrogate(Model):
         Returns:
             float: Error based on desired metric
         """
-        return {
-            "sum_squared": lambda: np.sum((y_test - y_posterior_mean) ** 2),
-            "mean_squared": lambda: np.mean((y_test - y_posterior_mean) ** 2),
-            "root_mean_squared": lambda: np.sqrt(np.mean((y_test - y_posterior_mean) ** 2)),
-            "sum_abs": lambda: np.sum(np.abs(y_test - y_posterior_mean)),
-            "mean_abs": lambda: np.mean(np.abs(y_test - y_posterior_mean)),
-            "abs_max": lambda: np.max(np.abs(y_test - y_posterior_mean)),
-            "nash_sutcliffe_efficiency": lambda: Surrogate.compute_nash_sutcliffe_efficiency(
-                y_test, y_posterior_mean
-            ),
-        }.get(measure, NotImplementedError("Desired error measure is unknown!"))()
+        return self.compute_error_measures(y_test, y_posterior_mean, [measure])[measure]
 
     @staticmethod
     def compute_nash_sutcliffe_efficiency(y_test, y_posterior_mean):
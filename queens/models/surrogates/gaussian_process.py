@@ -40,6 +40,9 @@ else:
 
     configure_tensorflow(tf)
 
+# number of test points that are predicted at once
+_PREDICTION_CHUNK_SIZE = 4096
+
 
 class GaussianProcess(Surrogate):
     """Class for creating GP regression model based on GPFlow.
@@ -237,15 +240,19 @@ class GaussianProcess(Surrogate):
         x_test = self.scaler_x.transform(x_test)
 
         if support == "y":
-            mean, var = self.model.predict_y(x_test, full_cov=False)
+            mean, var = self.predict_in_chunks(self.model.predict_y, x_test)
+        elif support == "f" and not full_cov:
+            mean, var = self.predict_in_chunks(self.model.predict_f, x_test)
         elif support == "f":
-            mean, var = self.model.predict_f(x_test, full_cov=full_cov)
+            mean, var = self.model.predict_f(x_test, full_cov=True)
+            mean = mean.numpy()
+            var = var.numpy()
         else:
             mean = None
             var = None
 
-        mean = self.scaler_y.inverse_transform(mean.numpy())
-        var = var.numpy() * self.scaler_y.var_
+        mean = self.scaler_y.inverse_transform(mean)
+        var = var * self.scaler_y.var_
 
         output = {"result": mean.reshape(number_test_samples, -1), "x_test": x_test}
         if support == "f" and full_cov:
@@ -270,6 +277,31 @@ class GaussianProcess(Surrogate):
 
         return output
 
+    @staticmethod
+    def predict_in_chunks(predict_method, x_test):
+        """Predict mean and variance for chunks of the test points.
+
+        Only the cross-covariance between one chunk of test points and the training points is
+        assembled at a time, which bounds the memory for large numbers of test points.
+
+        Args:
+            predict_method (function): Prediction method of the GPFlow model
+            x_test (np.ndarray): Scaled test inputs
+
+        Returns:
+            mean (np.ndarray): Predicted mean
+            var (np.ndarray): Predicted variance
+        """
+        mean = []
+        var = []
+        for start in range(0, x_test.shape[0], _PREDICTION_CHUNK_SIZE):
+            mean_chunk, var_chunk = predict_method(
+                x_test[start : start + _PREDICTION_CHUNK_SIZE], full_cov=False
+            )
+            mean.append(mean_chunk.numpy())
+            var.append(var_chunk.numpy())
+        return np.concatenate(mean), np.concatenate(var)
+
     def assign_hyperparameters(self, hyperparameters, transform=False):
         """Assign untransformed (constrained) hyperparameters to model.
 
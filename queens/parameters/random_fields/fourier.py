@@ -163,7 +163,10 @@ class Fourier(RandomField):
         Returns:
             sample_expanded (np.ndarray): Expanded representation of samples
         """
-        sample_expanded = self.mean + self.std * np.matmul(samples, self.basis.T)
+        # scale the projection in place to avoid another temporary of the expanded size
+        sample_expanded = np.matmul(samples, self.basis.T)
+        sample_expanded *= self.std
+        sample_expanded += self.mean
         return sample_expanded
 
     def latent_gradient(self, upstream_gradient):
@@ -176,7 +179,8 @@ class Fourier(RandomField):
             latent_grad (np.ndarray): Gradient of the realization of the random field with
                                       respect to the latent space variables
         """
-        latent_grad = self.std * np.matmul(upstream_gradient, self.basis)
+        latent_grad = np.matmul(upstream_gradient, self.basis)
+        latent_grad *= self.std
         return latent_grad
 
     def check_convergence(self):
@@ -212,7 +216,7 @@ class DimensionMethods1D:
         dim_one_wave_numbers = wave_numbers
         index = dim_one_wave_numbers
         covariance_index = index <= trunc_threshold
-        latent_index = np.kron(covariance_index, np.ones(shape=(2,))).astype(bool)
+        latent_index = np.repeat(covariance_index, 2)
         dimension = np.sum(latent_index, dtype=int)
 
         return covariance_index, latent_index, basis_dimension, dimension
@@ -300,11 +304,10 @@ class DimensionMethods2D:
         wave_numbers = (
             np.linspace(0, number_expansion_terms - 1, number_expansion_terms, dtype=int) ** 2
         )
-        dim_one_wave_numbers = np.kron(wave_numbers, np.ones(shape=(number_expansion_terms,)))
-        dim_two_wave_numbers = np.kron(np.ones(shape=(number_expansion_terms,)), wave_numbers)
-        index = dim_one_wave_numbers + dim_two_wave_numbers
+        # sum of the wave numbers of all combinations of frequencies in the two directions
+        index = np.add.outer(wave_numbers, wave_numbers).ravel()
         covariance_index = index <= trunc_threshold
-        latent_index = np.kron(covariance_index, np.ones(shape=(4,))).astype(bool)
+        latent_index = np.repeat(covariance_index, 4)
 
         dimension = np.sum(latent_index, dtype=int)
 
@@ -333,7 +336,7 @@ class DimensionMethods2D:
             * np.exp(-((c_k * np.pi * corr_length) ** 2) / (2 * convex_hull_size) ** 2)
         )
         c_k[0] = corr_length * np.sqrt(np.pi) / (2 * convex_hull_size)
-        cov_vector = np.kron(c_k, c_k)
+        cov_vector = np.outer(c_k, c_k).ravel()
         covariance = np.sqrt(cov_vector)
         return covariance
 
@@ -368,23 +371,10 @@ class DimensionMethods2D:
         sin_x0 = np.sin(arguements[0])
         sin_x1 = np.sin(arguements[1])
 
-        terms = np.zeros(shape=(4, len(coordinates), len(covariance)))
-        for i in range(len(coordinates)):
-            terms[:, i, :] = np.array(
-                [
-                    np.kron(cosine_x0[i, :], cosine_x1[i, :]),
-                    np.kron(sin_x0[i, :], sin_x1[i, :]),
-                    np.kron(cosine_x0[i, :], sin_x1[i, :]),
-                    np.kron(sin_x0[i, :], cosine_x1[i, :]),
-                ]
-            )
-
-        terms = np.multiply(terms, covariance)
-
-        basis[:, 0::4] = terms[0]
-        basis[:, 1::4] = terms[1]
-        basis[:, 2::4] = terms[2]
-        basis[:, 3::4] = terms[3]
+        basis[:, 0::4] = row_wise_kron(cosine_x0, cosine_x1) * covariance
+        basis[:, 1::4] = row_wise_kron(sin_x0, sin_x1) * covariance
+        basis[:, 2::4] = row_wise_kron(cosine_x0, sin_x1) * covariance
+        basis[:, 3::4] = row_wise_kron(sin_x0, cosine_x1) * covariance
 
         return basis[:, index]
 
@@ -413,15 +403,10 @@ class DimensionMethods3D:
         wave_numbers = (
             np.linspace(0, number_expansion_terms - 1, number_expansion_terms, dtype=int) ** 2
         )
-        dim_one_wave_numbers = np.kron(wave_numbers, np.ones(shape=(number_expansion_terms**2,)))
-        dim_two_wave_numbers = np.kron(
-            np.kron(np.ones(shape=(number_expansion_terms,)), wave_numbers),
-            np.ones(shape=(number_expansion_terms,)),
-        )
-        dim_three_wave_numbers = np.kron(np.ones(shape=(number_expansion_terms**2,)), wave_numbers)
-        index = dim_one_wave_numbers + dim_two_wave_numbers + dim_three_wave_numbers
+        # sum of the wave numbers of all combinations of frequencies in the three directions
+        index = np.add.outer(np.add.outer(wave_numbers, wave_numbers), wave_numbers).ravel()
         covarance_index = index <= trunc_threshold
-        latent_index = np.kron(covarance_index, np.ones(shape=(8,))).astype(bool)
+        latent_index = np.repeat(covarance_index, 8)
 
         dimension = np.sum(latent_index, dtype=int)
         return covarance_index, latent_index, basis_dimension, dimension
@@ -449,8 +434,8 @@ class DimensionMethods3D:
             * np.exp(-((c_k * np.pi * corr_length) ** 2) / (2 * convex_hull_size) ** 2)
         )
         c_k[0] = corr_length * np.sqrt(np.pi) / (2 * convex_hull_size)
-        cov_vector = np.kron(c_k, c_k)
-        cov_vector3d = np.kron(c_k, cov_vector)
+        cov_vector = np.outer(c_k, c_k).ravel()
+        cov_vector3d = np.outer(c_k, cov_vector).ravel()
         covariance = np.sqrt(cov_vector3d)
         return covariance
 
@@ -492,54 +477,31 @@ class DimensionMethods3D:
         sin_x1 = np.sin(arguements[1])
         sin_x2 = np.sin(arguements[2])
 
-        terms = np.zeros(shape=(8, len(coordinates), len(covariance)))
-        for i in range(len(coordinates)):
-            terms[:, i, :] = np.array(
-                [
-                    np.kron(
-                        np.kron(cosine_x0[i, :], cosine_x1[i, :]),
-                        cosine_x2[i, :],
-                    ),
-                    np.kron(
-                        np.kron(sin_x0[i, :], sin_x1[i, :]),
-                        cosine_x2[i, :],
-                    ),
-                    np.kron(
-                        np.kron(cosine_x0[i, :], sin_x1[i, :]),
-                        cosine_x2[i, :],
-                    ),
-                    np.kron(
-                        np.kron(sin_x0[i, :], cosine_x1[i, :]),
-                        cosine_x2[i, :],
-                    ),
-                    np.kron(
-                        np.kron(cosine_x0[i, :], cosine_x1[i, :]),
-                        sin_x2[i, :],
-                    ),
-                    np.kron(
-                        np.kron(sin_x0[i, :], sin_x1[i, :]),
-                        sin_x2[i, :],
-                    ),
-                    np.kron(
-                        np.kron(cosine_x0[i, :], sin_x1[i, :]),
-                        sin_x2[i, :],
-                    ),
-                    np.kron(
-                        np.kron(sin_x0[i, :], cosine_x1[i, :]),
-                        sin_x2[i, :],
-                    ),
-                ]
-            )
-
-        terms = np.multiply(terms, covariance)
-
-        basis[:, 0::8] = terms[0]
-        basis[:, 1::8] = terms[1]
-        basis[:, 2::8] = terms[2]
-        basis[:, 3::8] = terms[3]
-        basis[:, 4::8] = terms[4]
-        basis[:, 5::8] = terms[5]
-        basis[:, 6::8] = terms[6]
-        basis[:, 7::8] = terms[7]
+        basis[:, 0::8] = row_wise_kron(cosine_x0, cosine_x1, cosine_x2) * covariance
+        basis[:, 1::8] = row_wise_kron(sin_x0, sin_x1, cosine_x2) * covariance
+        basis[:, 2::8] = row_wise_kron(cosine_x0, sin_x1, cosine_x2) * covariance
+        basis[:, 3::8] = row_wise_kron(sin_x0, cosine_x1, cosine_x2) * covariance
+        basis[:, 4::8] = row_wise_kron(cosine_x0, cosine_x1, sin_x2) * covariance
+        basis[:, 5::8] = row_wise_kron(sin_x0, sin_x1, sin_x2) * covariance
+        basis[:, 6::8] = row_wise_kron(cosine_x0, sin_x1, sin_x2) * covariance
+        basis[:, 7::8] = row_wise_kron(sin_x0, cosine_x1, sin_x2) * covariance
 
         return basis[:, index]
+
+
+def row_wise_kron(*factors):
+    """Compute the row-wise Kronecker product of matrices.
+
+    Args:
+        factors (np.array): Matrices with the same number of rows
+
+    Returns:
+        product (np.array): Matrix whose rows are the Kronecker products of the corresponding rows
+                            of the factors
+    """
+    product = factors[0]
+    for factor in factors[1:]:
+        product = (product[:, :, np.newaxis] * factor[:, np.newaxis, :]).reshape(
+            product.shape[0], -1
+        )
+    return product
@@ -14,6 +14,8 @@
 #
 """Custom exceptions."""
 
+import shlex
+
 
 class QueensException(Exception):
     """QUEENS exception."""
@@ -59,7 +61,7 @@ class SubprocessError(QueensException):
         """Construct a Subprocess error from a command and its outputs.
 
         Args:
-            command (str): Command used that raised the error
+            command (str, list): Command used that raised the error
             command_output (str): Command output
             error_message (str): Error message of the command
             additional_message (str, optional): Additional message to pass
@@ -67,6 +69,8 @@ class SubprocessError(QueensException):
         Returns:
             SubprocessError
         """
+        if not isinstance(command, str):
+            command = shlex.join(str(argument) for argument in command)
         message = "\n\nQUEENS' subprocess wrapper caught the following error:\n"
         message += error_message
         message += "\n\n\nwith commandline output:\n"
@@ -18,6 +18,7 @@ The module supplies functions to inject parameter values into a template
 text file.
 """
 
+from functools import lru_cache
 from pathlib import Path
 
 from jinja2 import Environment, StrictUndefined, Undefined
@@ -25,6 +26,24 @@ from jinja2 import Environment, StrictUndefined, Undefined
 from queens.utils.io import read_file
 
 
+@lru_cache(maxsize=32)
+def _compile_template(template, strict):
+    """Compile a template.
+
+    Compiling a jinja template is considerably more expensive than rendering it. Since the same
+    templates are rendered for every job, the compiled templates are cached.
+
+    Args:
+        template (str): Template file as string
+        strict (bool): Raises exception if required parameters from the template are missing
+
+    Returns:
+        jinja2.Template: compiled template
+    """
+    undefined = StrictUndefined if strict else Undefined
+    return Environment(undefined=undefined).from_string(template)
+
+
 def render_template(params, template, strict=True):
     """Function to insert parameters into a template.
 
@@ -36,10 +55,7 @@ def render_template(params, template, strict=True):
     Returns:
         str: injected template
     """
-    undefined = StrictUndefined if strict else Undefined
-
-    environment = Environment(undefined=undefined).from_string(template)
-    return environment.render(**params)
+    return _compile_template(template, strict).render(**params)
 
 
 def inject_in_template(params, template, output_file, strict=True):
@@ -17,6 +17,7 @@
 import csv
 import logging
 import pickle
+from functools import partial
 from pathlib import Path
 
 import yaml
@@ -28,6 +29,13 @@ try:
 except ImportError:
     import json
 
+# Use the LibYAML-based C implementations if PyYAML was built with them
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
 
 _logger = logging.getLogger(__name__)
 
@@ -112,7 +120,7 @@ def load_input_file(input_file_path):
     if file_type == ".json":
         loader = json.load
     elif file_type in [".yml", ".yaml"]:
-        loader = yaml.safe_load
+        loader = partial(yaml.load, Loader=SafeLoader)
     else:
         raise FileTypeError(
             f"Only json or yaml/yml files allowed, not of type '{file_type}' ({input_file_path})"
@@ -24,7 +24,7 @@ import yaml
 from pandas.io.json._normalize import nested_to_record
 
 from queens.utils.config_directories import job_dirs_in_experiment_dir
-from queens.utils.io import to_dict_with_standard_types
+from queens.utils.io import SafeDumper, SafeLoader, to_dict_with_standard_types
 from queens.utils.printing import get_str_table
 
 METADATA_FILENAME = "metadata"
@@ -77,8 +77,11 @@ class SimulationMetadata:
 
     def export(self):
         """Export the object to human readable format."""
-        yaml_string = yaml.safe_dump(
-            to_dict_with_standard_types(self.to_dict()), sort_keys=False, default_flow_style=False
+        yaml_string = yaml.dump(
+            to_dict_with_standard_types(self.to_dict()),
+            Dumper=SafeDumper,
+            sort_keys=False,
+            default_flow_style=False,
         )
         self.file_path.write_text(yaml_string, encoding="utf-8")
 
@@ -141,7 +144,7 @@ def get_metadata_from_experiment_dir(experiment_dir):
     """
     for job_dir in job_dirs_in_experiment_dir(experiment_dir):
         metadata_path = (job_dir / METADATA_FILENAME).with_suffix(METADATA_FILETYPE)
-        yield yaml.safe_load(metadata_path.read_text())
+        yield yaml.load(metadata_path.read_text(), Loader=SafeLoader)
 
 
 def write_metadata_to_csv(experiment_dir, csv_path=None):
@@ -21,11 +21,18 @@ distribution.
 import logging
 
 import numpy as np
+from scipy.signal import fftconvolve
 from sklearn.model_selection import GridSearchCV
 from sklearn.neighbors import KernelDensity
 
 _logger = logging.getLogger(__name__)
 
+# settings of the FFT-based kde
+_FFT_MIN_NUM_SAMPLES = 2000
+_FFT_GRID_POINTS_PER_BANDWIDTH = 40
+_FFT_KERNEL_CUTOFF = 6.0
+_FFT_MAX_GRID_POINTS = 2**20
+
 
 def estimate_bandwidth_for_kde(samples, min_samples, max_samples, kernel="gaussian"):
     """Estimate optimal bandwidth for kde of pdf.
@@ -58,7 +65,7 @@ def estimate_bandwidth_for_kde(samples, min_samples, max_samples, kernel="gaussi
     return kernel_bandwidth
 
 
-def estimate_pdf(samples, kernel_bandwidth, support_points=None, kernel="gaussian"):
+def estimate_pdf(samples, kernel_bandwidth, support_points=None, kernel="gaussian", use_fft=False):
     """Estimate pdf using kernel density estimation.
 
     Args:
@@ -66,6 +73,8 @@ def estimate_pdf(samples, kernel_bandwidth, support_points=None, kernel="gaussia
         kernel_bandwidth (float):   Kernel width to use in kde
         support_points (np.array):  Points where to evaluate pdf
         kernel (str, optional):               Kernel type
+        use_fft (bool, optional):   Use the FFT-based kde for many one-dimensional samples and a
+                                    Gaussian kernel
 
     Returns:
         np.ndarray, np.ndarray: *pdf_estimate* at support points
@@ -73,7 +82,7 @@ def estimate_pdf(samples, kernel_bandwidth, support_points=None, kernel="gaussia
     # make sure that we have at least 2 D column vectors but do not change correct 2D format
     samples = np.atleast_2d(samples).T
 
-    # support points given
+    # no support points given
     if support_points is None:
         min_samples = np.amin(samples)
         max_samples = np.amax(samples)
@@ -89,8 +98,62 @@ def estimate_pdf(samples, kernel_bandwidth, support_points=None, kernel="gaussia
     else:
         support_points = np.atleast_2d(support_points).T
 
-        # no support points given
+    # use the FFT-based kde for many one-dimensional samples
+    if (
+        use_fft
+        and kernel == "gaussian"
+        and samples.shape[1] == 1
+        and samples.shape[0] >= _FFT_MIN_NUM_SAMPLES
+    ):
+        y_density = estimate_pdf_fft(samples[:, 0], kernel_bandwidth, support_points[:, 0])
+        if y_density is not None:
+            return y_density, support_points
+
     kde = KernelDensity(kernel=kernel, bandwidth=kernel_bandwidth).fit(samples)
 
     y_density = np.exp(kde.score_samples(support_points))
     return y_density, support_points
+
+
+def estimate_pdf_fft(samples, kernel_bandwidth, support_points):
+    """Estimate one-dimensional pdf using a FFT-based Gaussian kde.
+
+    The samples are linearly binned on a fine regular grid, which is then convolved with the
+    discretized Gaussian kernel using the FFT. The density on the grid is linearly interpolated to
+    the support points. The costs scale with the number of samples plus the number of grid points
+    instead of their product.
+
+    Args:
+        samples (np.array):         One-dimensional samples for which to estimate pdf
+        kernel_bandwidth (float):   Kernel width to use in kde
+        support_points (np.array):  One-dimensional points where to evaluate pdf
+
+    Returns:
+        np.ndarray: *pdf_estimate* at support points or *None* if the required grid is too large
+    """
+    grid_spacing = kernel_bandwidth / _FFT_GRID_POINTS_PER_BANDWIDTH
+    num_kernel_points = int(np.ceil(_FFT_KERNEL_CUTOFF * _FFT_GRID_POINTS_PER_BANDWIDTH))
+    margin = (num_kernel_points + 1) * grid_spacing
+    lower_bound = min(np.amin(samples), np.amin(support_points)) - margin
+    upper_bound = max(np.amax(samples), np.amax(support_points)) + margin
+    num_grid_points = int(np.ceil((upper_bound - lower_bound) / grid_spacing)) + 1
+    if num_grid_points > _FFT_MAX_GRID_POINTS:
+        return None
+
+    # linear binning of the samples on the grid
+    positions = (samples - lower_bound) / grid_spacing
+    left_indices = np.floor(positions).astype(int)
+    right_weights = positions - left_indices
+    counts = np.bincount(left_indices, weights=1.0 - right_weights, minlength=num_grid_points)
+    counts += np.bincount(left_indices + 1, weights=right_weights, minlength=num_grid_points)
+
+    kernel_offsets = np.arange(-num_kernel_points, num_kernel_points + 1) * grid_spacing
+    kernel_values = np.exp(-0.5 * (kernel_offsets / kernel_bandwidth) ** 2) / (
+        np.sqrt(2.0 * np.pi) * kernel_bandwidth
+    )
+    grid_density = fftconvolve(counts, kernel_values, mode="same") / samples.size
+    grid_points = lower_bound + np.arange(num_grid_points) * grid_spacing
+
+    y_density = np.interp(support_points, grid_points, grid_density)
+    # remove round-off artifacts of the FFT
+    return np.maximum(y_density, 0.0)
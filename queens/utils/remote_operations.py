@@ -222,7 +222,7 @@ class RemoteConnection(Connection):
     def sync_remote_repository(self):
         """Synchronize local and remote QUEENS source files."""
         _logger.info("Syncing remote QUEENS repository with local one...")
-        start_time = time.time()
+        start_time = time.perf_counter()
         self.create_remote_directory(self.remote_queens_repository)
 
         source = f"{PATH_TO_QUEENS}/"
@@ -230,7 +230,7 @@ class RemoteConnection(Connection):
             source, self.remote_queens_repository, exclude=".git", filters=":- .gitignore"
         )
         _logger.info("Sync of remote repository was successful.")
-        _logger.info("It took: %s s.\n", time.time() - start_time)
+        _logger.info("It took: %s s.\n", time.perf_counter() - start_time)
 
     def copy_to_remote(self, source, destination, verbose=True, exclude=None, filters=None):
         """Copy files or folders to remote.
@@ -312,7 +312,7 @@ class RemoteConnection(Connection):
             package_manager = FALLBACK_PACKAGE_MANAGER
 
         _logger.info("Build remote QUEENS environment...")
-        start_time = time.time()
+        start_time = time.perf_counter()
         environment_name = Path(self.remote_python).parents[1].name
         command_string = (
             f"cd {self.remote_queens_repository}; "
@@ -325,7 +325,7 @@ class RemoteConnection(Connection):
 
         _logger.debug(result.stdout)
         _logger.info("Build of remote queens environment was successful.")
-        _logger.info("It took: %s s.\n", time.time() - start_time)
+        _logger.info("It took: %s s.\n", time.perf_counter() - start_time)
 
 
 def get_port():
@@ -35,21 +35,33 @@ def run_subprocess(
 
     return stderr and stdout
     Args:
-        command (str): command, that will be run in subprocess
+        command (str, list): command, that will be run in subprocess. A string is run in a shell,
+                             a list of arguments is executed directly without spawning a shell.
         raise_error_on_subprocess_failure (bool, optional): Raise or warn error defaults to True
         additional_error_message (str, optional): Additional error message to be displayed
         allowed_errors (lst, optional): List of strings to be removed from the error message
     Returns:
         process_returncode (int): code for success of subprocess
         process_id (int): unique process id, the subprocess was assigned on computing machine
+                          (*None* if the program of an argument list could not be executed)
         stdout (str): standard output content
         stderr (str): standard error content
     """
-    process = start_subprocess(command)
-
-    stdout, stderr = process.communicate()
-    process_id = process.pid
-    process_returncode = process.returncode
+    try:
+        process = start_subprocess(command)
+    except OSError as error:
+        if isinstance(command, str):
+            raise
+        # without a shell a missing or non-executable program raises instead of failing, so it is
+        # reported with the return code and error message the shell would have given
+        process_returncode = 127 if isinstance(error, FileNotFoundError) else 126
+        process_id = None
+        stdout = ""
+        stderr = str(error)
+    else:
+        stdout, stderr = process.communicate()
+        process_id = process.pid
+        process_returncode = process.returncode
 
     _raise_or_warn_error(
         command=command,
@@ -66,7 +78,8 @@ def start_subprocess(command):
     """Start subprocess.
 
     Args:
-        command (str): command, that will be run in subprocess
+        command (str, list): command, that will be run in subprocess. A string is run in a shell,
+                             a list of arguments is executed directly without spawning a shell.
 
     Returns:
          process (subprocess.Popen): subprocess object
@@ -76,7 +89,7 @@ def start_subprocess(command):
         stdin=subprocess.PIPE,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        shell=True,
+        shell=isinstance(command, str),
         universal_newlines=True,
     )
     return process
@@ -93,7 +106,7 @@ def _raise_or_warn_error(
     """Raise or warn eventual exception if subprocess fails.
 
     Args:
-        command (str): Command string
+        command (str, list): Command string or list of arguments
         stdout (str): Command output
         stderr (str): Error of the output
         raise_error_on_subprocess_failure (bool): Raise or warn error defaults to True
@@ -124,14 +137,16 @@ def _remove_allowed_errors(stderr, allowed_errors):
     Returns:
         stderr (str): error message without allowed errors
     """
-    # Add known exceptions
-    allowed_errors.extend(_ALLOWED_ERRORS)
-    # Remove the allowed error messages from stderr
-    for error_message in allowed_errors:
+    # Nothing to filter for the common case of a clean stderr
+    if not stderr:
+        return stderr
+
+    # Remove the allowed error messages and known exceptions from stderr
+    for error_message in [*allowed_errors, *_ALLOWED_ERRORS]:
         stderr = stderr.replace(error_message, "")
 
-    # Remove trailing spaces, tabs and newlines and check if an error message remains
-    if "".join(stderr.split()) == "":
+    # Check if an error message remains apart from spaces, tabs and newlines
+    if not stderr or stderr.isspace():
         stderr = ""
 
     return stderr
@@ -135,8 +135,8 @@ def test_write_random_material_to_dat(
         results = load_result(global_settings.result_file(".pickle"))
 
         # Check if we got the expected results
-        np.testing.assert_array_almost_equal(results["mean"], expected_mean, decimal=8)
-        np.testing.assert_array_almost_equal(results["var"], expected_var, decimal=8)
+        np.testing.assert_allclose(results["mean"], expected_mean, rtol=0, atol=1.5e-8)
+        np.testing.assert_allclose(results["var"], expected_var, rtol=0, atol=1.5e-8)
     except Exception as error:
         experiment_dir = experiment_directory(global_settings.experiment_name)
         job_dir = experiment_dir / "0"
@@ -147,7 +147,7 @@ def test_write_random_material_to_dat(
         raise error
 
 
-@pytest.fixture(name="expected_mean")
+@pytest.fixture(name="expected_mean", scope="module")
 def fixture_expected_mean():
     """Reference samples mean."""
     result = np.array(
@@ -278,7 +278,7 @@ def fixture_expected_mean():
     return result
 
 
-@pytest.fixture(name="expected_var")
+@pytest.fixture(name="expected_var", scope="module")
 def fixture_expected_var():
     """Reference samples var."""
     result = np.array(
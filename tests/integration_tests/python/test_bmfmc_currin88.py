@@ -118,3 +118,36 @@ def test_bmfmc_iterator_currin88_random_vars_diverse_design(
 
     kl_divergence = entropy(p_yhf_mc, results["raw_output_data"]["p_yhf_mean"])
     assert kl_divergence < 0.3
+
+
+def test_bmfmc_predictive_var_gaussian_process(lf_mc_data, hf_mc_data, global_settings):
+    """Test the posterior variance of the HF density with a GPflow based mapping.
+
+    The pairwise covariances of the Monte-Carlo points have to be provided by the full
+    posterior covariance matrix of the Gaussian process.
+    """
+    parameters = Parameters(
+        x1=Uniform(lower_bound=0.0, upper_bound=1.0), x2=Uniform(lower_bound=0.0, upper_bound=1.0)
+    )
+    probabilistic_mapping = GaussianProcess(number_restarts=1, number_training_iterations=100)
+    model = BMFMCModel(
+        predictive_var=True,
+        BMFMC_reference=False,
+        y_pdf_support_min=-0.5,
+        y_pdf_support_max=15.0,
+        features_config="no_features",
+        probabilistic_mapping=probabilistic_mapping,
+        parameters=parameters,
+        global_settings=global_settings,
+        path_to_lf_mc_data=(),
+    )
+    num_train = 50
+    num_mc = 200
+    model.interface.build_approximation(lf_mc_data[:num_train], hf_mc_data[:num_train])
+    model.Z_mc = lf_mc_data[:num_mc]
+    model.m_f_mc, model.var_y_mc = model.interface.evaluate(model.Z_mc.T)
+
+    model.compute_pyhf_statistics()
+
+    assert model.p_yhf_var.shape == model.y_pdf_support.shape
+    assert np.all(np.isfinite(model.p_yhf_var))
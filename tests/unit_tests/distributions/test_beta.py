@@ -18,10 +18,10 @@ import numpy as np
 import pytest
 import scipy.stats
 
-from queens.distributions.beta import Beta
+from queens.distributions.beta import Beta, beta_logpdf_scalar
 
 
-@pytest.fixture(name="sample_pos", params=[0.5, [-1.0, 0.0, 1.0, 2.0]])
+@pytest.fixture(name="sample_pos", params=[0.5, [-1.0, 0.0, 1.0, 2.0], [-2.0, 3.0]])
 def fixture_sample_pos(request):
     """Sample position to be evaluated."""
     return np.array(request.param)
@@ -71,8 +71,8 @@ def test_init_beta(beta, lower_bound, upper_bound, shape_a, shape_b):
     var_ref = scipy.stats.beta.var(a=shape_a, b=shape_b, loc=lower_bound, scale=width)
 
     assert beta.dimension == 1
-    np.testing.assert_equal(beta.mean, mean_ref)
-    np.testing.assert_equal(beta.covariance, var_ref)
+    np.testing.assert_allclose(beta.mean, mean_ref)
+    np.testing.assert_allclose(beta.covariance, var_ref)
     np.testing.assert_equal(beta.lower_bound, lower_bound)
     np.testing.assert_equal(beta.upper_bound, upper_bound)
     np.testing.assert_equal(beta.a, shape_a)
@@ -99,14 +99,15 @@ def test_cdf_beta(beta, lower_bound, upper_bound, sample_pos, shape_a, shape_b):
     ref_sol = scipy.stats.beta.cdf(
         sample_pos, a=shape_a, b=shape_b, loc=lower_bound, scale=width
     ).reshape(-1)
-    np.testing.assert_equal(beta.cdf(sample_pos), ref_sol)
+    np.testing.assert_allclose(beta.cdf(sample_pos), ref_sol)
 
 
 def test_draw_beta(beta, lower_bound, upper_bound, mocker):
     """Test the draw method of beta distribution."""
-    sample = np.asarray(0.5 * (lower_bound + upper_bound)).reshape(1, 1)
-    mocker.patch("scipy.stats._distn_infrastructure.rv_frozen.rvs", return_value=sample)
+    standard_sample = np.array([[0.5]])
+    mocker.patch("numpy.random.beta", return_value=standard_sample)
     draw = beta.draw()
+    sample = lower_bound + (upper_bound - lower_bound) * standard_sample
     np.testing.assert_equal(draw, sample)
 
 
@@ -116,7 +117,45 @@ def test_logpdf_beta(beta, lower_bound, upper_bound, sample_pos, shape_a, shape_
     ref_sol = scipy.stats.beta.logpdf(
         sample_pos, a=shape_a, b=shape_b, loc=lower_bound, scale=width
     ).reshape(-1)
-    np.testing.assert_equal(beta.logpdf(sample_pos), ref_sol)
+    np.testing.assert_allclose(beta.logpdf(sample_pos), ref_sol)
+
+
+def test_beta_logpdf_scalar(beta, sample_pos):
+    """Test the jitted scalar log pdf of the beta distribution."""
+    logpdf_scalar = [
+        beta_logpdf_scalar(
+            x,
+            float(beta.a),
+            float(beta.b),
+            beta.lower_bound[0],
+            beta.width[0],
+            beta.logpdf_const[0],
+        )
+        for x in np.atleast_1d(sample_pos)
+    ]
+    np.testing.assert_allclose(logpdf_scalar, beta.logpdf(sample_pos))
+
+
+def test_batch_logpdf_beta():
+    """Test the vectorized log pdf of several beta distributions."""
+    sample_pos = np.array([[-1.5], [0.0], [0.5], [2.0]])
+    lower_bound = np.array([-1.0, 0.0, 0.5])
+    upper_bound = np.array([2.0, 1.0, 3.0])
+    shape_a = np.array([3.0, 1.0, 0.7])
+    shape_b = np.array([0.5, 1.0, 2.3])
+    ref_sol = scipy.stats.beta.logpdf(
+        sample_pos, a=shape_a, b=shape_b, loc=lower_bound, scale=upper_bound - lower_bound
+    )
+    logpdf = Beta.batch_logpdf(sample_pos, lower_bound, upper_bound, shape_a, shape_b)
+    np.testing.assert_allclose(logpdf, ref_sol)
+
+
+@pytest.mark.parametrize("method", ["cdf", "logpdf", "pdf"])
+def test_single_precision_beta(beta, sample_pos, method):
+    """Test that single precision positions are evaluated in single precision."""
+    result = getattr(beta, method)(sample_pos.astype(np.float32))
+    assert result.dtype == np.float32
+    np.testing.assert_allclose(result, getattr(beta, method)(sample_pos), rtol=1e-5)
 
 
 def test_grad_logpdf_beta(beta, sample_pos):
@@ -134,7 +173,7 @@ def test_pdf_beta(beta, lower_bound, upper_bound, sample_pos, shape_a, shape_b):
     ref_sol = scipy.stats.beta.pdf(
         sample_pos, a=shape_a, b=shape_b, loc=lower_bound, scale=width
     ).reshape(-1)
-    np.testing.assert_equal(beta.pdf(sample_pos), ref_sol)
+    np.testing.assert_allclose(beta.pdf(sample_pos), ref_sol)
 
 
 def test_ppf_beta(beta, lower_bound, upper_bound, shape_a, shape_b):
@@ -144,4 +183,4 @@ def test_ppf_beta(beta, lower_bound, upper_bound, shape_a, shape_b):
     ref_sol = scipy.stats.beta.ppf(
         quantile, a=shape_a, b=shape_b, loc=lower_bound, scale=width
     ).reshape(-1)
-    np.testing.assert_equal(beta.ppf(quantile), ref_sol)
+    np.testing.assert_allclose(beta.ppf(quantile), ref_sol)
@@ -17,6 +17,8 @@
 import numpy as np
 import pytest
 from mock import Mock, patch
+from scipy.stats import multivariate_normal
+from sklearn.preprocessing import StandardScaler
 
 from queens.distributions.uniform import Uniform
 from queens.iterators.data import Data
@@ -287,8 +289,8 @@ def test_load_sampling_data(mocker, default_bmfmc_model, default_data_iterator,
     # run the current method
     default_bmfmc_model.load_sampling_data()
 
-    # tests min amount of data iterator calls
-    assert mp1.call_count >= 6
+    # test that every data file is read exactly once
+    assert mp1.call_count == 3
 
     # test assembling of multiple LF data
     np.testing.assert_array_almost_equal(
@@ -417,23 +419,74 @@ def test_calculate_p_yhf_var(mocker, default_bmfmc_model):
 
     expected_var = np.array(
         [
-            -0.0580733,
-            -0.00377325,
-            0.00100094,
-            0.001509,
-            0.00200187,
-            0.00251098,
-            0.00299406,
-            0.00341733,
-            0.00376561,
-            0.00404483,
+            -0.05808692,
+            -0.00383863,
+            0.00086301,
+            0.00129367,
+            0.00173436,
+            0.00225364,
+            0.00283801,
+            0.00345564,
+            0.00405492,
+            0.00457148,
         ]
     )
     # asserts / tests
     mp1.assert_called_once()
+    assert mp1.call_args.kwargs["support"] == "f"
+    assert mp1.call_args.kwargs["full_cov"]
     np.testing.assert_array_almost_equal(default_bmfmc_model.p_yhf_var, expected_var, decimal=8)
 
 
+def test_calculate_p_yhf_var_checks_covariance(mocker, default_bmfmc_model):
+    """Test that a posterior variance instead of a covariance matrix is rejected."""
+    mocker.patch(
+        "queens.models.bmfmc.BmfmcInterface.evaluate", return_value=(None, np.ones((10, 1)))
+    )
+    default_bmfmc_model.var_y_mc = np.ones((10, 1))
+    default_bmfmc_model.m_f_mc = np.zeros((10, 1))
+    default_bmfmc_model.y_pdf_support = np.linspace(-1.0, 1.0, 10)
+
+    with pytest.raises(ValueError, match="covariance"):
+        default_bmfmc_model.calculate_p_yhf_var()
+
+
+def test_calculate_p_yhf_var_single_point(mocker, default_bmfmc_model):
+    """Test that the variance is skipped for a single Monte-Carlo point."""
+    mocker.patch(
+        "queens.models.bmfmc.BmfmcInterface.evaluate", return_value=(None, np.ones((1, 1)))
+    )
+    default_bmfmc_model.var_y_mc = np.ones((1, 1))
+    default_bmfmc_model.m_f_mc = np.zeros((1, 1))
+    default_bmfmc_model.y_pdf_support = np.linspace(-1.0, 1.0, 10)
+
+    default_bmfmc_model.calculate_p_yhf_var()
+
+    assert default_bmfmc_model.p_yhf_var is None
+
+
+def test_accumulate_pair_pdfs():
+    """Test summation of bivariate normal densities of all pairs of points."""
+    f_mean = np.array([0.0, 0.5, 1.0])
+    var = np.array([1.0, 2.0, 1.5])
+    k_post = np.array([[1.0, 0.3, 0.2], [0.3, 2.0, 0.4], [0.2, 0.4, 1.5]])
+    y_support = np.linspace(-1.0, 2.0, 5)
+
+    pdf_grid = bmfmc.accumulate_pair_pdfs(f_mean, var, k_post, y_support, 2)
+
+    points = np.vstack((y_support, y_support)).T
+    expected_pdf_grid = np.zeros(y_support.shape)
+    for num1 in range(3):
+        for num2 in range(num1 + 1, 3):
+            covariance = k_post[num1, num2]
+            expected_pdf_grid += multivariate_normal.pdf(
+                points,
+                mean=[f_mean[num1], f_mean[num2]],
+                cov=[[var[num1], covariance], [covariance, var[num2]]],
+            )
+    np.testing.assert_allclose(pdf_grid, expected_pdf_grid, rtol=1e-12)
+
+
 def test_compute_pymc_reference(mocker, default_bmfmc_model):
     """Test computation of reference kernel density estimate."""
     mp1 = mocker.patch("queens.utils.pdf_estimation.estimate_bandwidth_for_kde", return_value=1.0)
@@ -447,6 +500,22 @@ def test_compute_pymc_reference(mocker, default_bmfmc_model):
     mp2.assert_called_once()
 
 
+def test_compute_pymc_reference_subsamples_bandwidth_estimation(mocker, default_bmfmc_model):
+    """Test that the bandwidth is estimated on a subsample of large LF MC datasets."""
+    mp1 = mocker.patch("queens.utils.pdf_estimation.estimate_bandwidth_for_kde", return_value=1.0)
+    mocker.patch("queens.utils.pdf_estimation.estimate_pdf", return_value=(1.0, None))
+
+    default_bmfmc_model.Y_LFs_mc = np.linspace(-1.0, 1.0, 20001).reshape(-1, 1)
+    default_bmfmc_model.Y_LFs_train = np.array([[1.0, 1.0]])
+    default_bmfmc_model.compute_pymc_reference()
+
+    samples, min_samples, max_samples = mp1.call_args.args
+    assert samples.size == 10000
+    assert np.unique(samples).size == 10000
+    assert min_samples == -1.0
+    assert max_samples == 1.0
+
+
 def test_set_feature_strategy(mocker, default_bmfmc_model):
     """Test setting feature strategy."""
     mp1 = mocker.patch("queens.models.bmfmc.BMFMC.update_probabilistic_mapping_with_features")
@@ -501,10 +570,8 @@ def test_calculate_extended_gammas(mocker, default_bmfmc_model):
 
     mp1 = mocker.patch("queens.models.bmfmc.BMFMC.input_dim_red", return_value=x_red)
     mp2 = mocker.patch.object(visualization, "plot_feature_ranking")
-    mp3 = mocker.patch(
-        "queens.models.bmfmc.StandardScaler.fit_transform", return_value=y_LFS_mc_stdized
-    )
 
+    default_bmfmc_model.Y_LFs_mc = y_LFS_mc_stdized
     default_bmfmc_model.visualization = visualization
 
     def linear_scale_dummy(a, b):  # pylint: disable=unused-argument
@@ -515,7 +582,6 @@ def test_calculate_extended_gammas(mocker, default_bmfmc_model):
 
         mp1.assert_called_once()
         mp2.assert_called_once()
-        mp3.assert_called_once()
 
         # test scores ranking functionality of informative features
         np.random.seed(1)
@@ -543,6 +609,7 @@ def test_update_probabilistic_mapping_with_features(mocker, default_bmfmc_model)
     mp1.assert_called_once()
     assert mp2.call_count == 2
     assert default_bmfmc_model.Z_mc.shape[1] == 2
+    assert np.shares_memory(default_bmfmc_model.Z_mc, default_bmfmc_model.Z_ext_mc)
 
 
 def test_input_dim_red(mocker, default_bmfmc_model):
@@ -584,6 +651,69 @@ def test_get_random_fields_and_truncated_basis(default_bmfmc_model):
     np.testing.assert_array_almost_equal(x_uncorr, expected_x_uncorr, decimal=6)
 
 
+def test_get_random_fields_and_truncated_basis_several_fields(default_bmfmc_model):
+    """Test that the truncated bases of all random fields are returned."""
+    random_field_coords = PreProcessor().coords_dict["random_inflow"]
+    random_fields = [
+        KarhunenLoeve(coords=random_field_coords, corr_length=0.08, latent_dimension=dimension)
+        for dimension in (3, 4)
+    ]
+    default_bmfmc_model.parameters = Parameters(
+        x1=Uniform(lower_bound=-2.0, upper_bound=2.0),
+        random_inflow=random_fields[0],
+        random_outflow=random_fields[1],
+    )
+    np.random.seed(1)
+    default_bmfmc_model.X_mc = np.random.random((5, 8))
+    default_bmfmc_model.eigenfunc_random_fields = {
+        "random_inflow": np.random.random((3, 3)),
+        "random_outflow": np.random.random((4, 4)),
+    }
+    default_bmfmc_model.eigenvals = {
+        "random_inflow": np.array([50.0, 90.0, 100.0]),
+        "random_outflow": np.array([70.0, 80.0, 99.0, 100.0]),
+    }
+
+    _, random_fields_trunc_dict = default_bmfmc_model.get_random_fields_and_truncated_basis(
+        explained_var=85.0
+    )
+
+    assert list(random_fields_trunc_dict) == ["random_inflow", "random_outflow"]
+    np.testing.assert_array_equal(
+        random_fields_trunc_dict["random_inflow"]["samples"], default_bmfmc_model.X_mc[:, 1:4]
+    )
+    np.testing.assert_array_equal(
+        random_fields_trunc_dict["random_outflow"]["samples"], default_bmfmc_model.X_mc[:, 4:8]
+    )
+    np.testing.assert_array_equal(
+        random_fields_trunc_dict["random_inflow"]["trunc_basis"],
+        default_bmfmc_model.eigenfunc_random_fields["random_inflow"][0:1],
+    )
+    np.testing.assert_array_equal(
+        random_fields_trunc_dict["random_outflow"]["trunc_basis"],
+        default_bmfmc_model.eigenfunc_random_fields["random_outflow"][0:2],
+    )
+
+
+def test_match_rows():
+    """Test lookup of rows in a reference array."""
+    reference_rows = np.array([[1.1, 1.2], [1.3, 1.4], [-0.0, 1.6], [1.3, 1.4]])
+    rows = np.array([[1.3, 1.4], [0.0, 1.6], [1.1, 1.2]])
+
+    indices = bmfmc.match_rows(rows, reference_rows)
+
+    np.testing.assert_array_equal(indices, np.array([1, 2, 0]))
+
+
+def test_match_rows_missing_row():
+    """Test that a row missing in the reference array is reported."""
+    reference_rows = np.array([[1.1, 1.2], [1.3, 1.4]])
+    rows = np.array([[1.3, 1.4], [1.5, 1.6]])
+
+    with pytest.raises(ValueError, match=r"training row 1 with values \[1.5 1.6\]"):
+        bmfmc.match_rows(rows, reference_rows)
+
+
 def test_project_samples_on_truncated_basis():
     """Test projection of samples on the truncated basis."""
     np.random.seed(1)
@@ -629,6 +759,23 @@ def test_linear_scale_a_to_b():
     scaled_a_vec = bmfmc.linear_scale_a_to_b(a_vec, b_vec)
     np.testing.assert_array_almost_equal(scaled_a_vec, expected_scaled_a_vec, decimal=6)
 
+    # columns of a matrix are scaled separately
+    a_mat = np.column_stack((a_vec, 3.0 * a_vec - 1.0))
+    expected_scaled_a_mat = np.column_stack((expected_scaled_a_vec, expected_scaled_a_vec))
+    scaled_a_mat = bmfmc.linear_scale_a_to_b(a_mat, b_vec)
+    np.testing.assert_array_almost_equal(scaled_a_mat, expected_scaled_a_mat, decimal=6)
+
+
+def test_standardize_columns():
+    """Test standardization of the columns of a data matrix."""
+    data = np.array([[1.0, 2.0, 3.0], [2.0, 2.0, 5.0], [6.0, 2.0, -1.0]])
+    expected_data_stdizd = StandardScaler().fit_transform(data)
+
+    data_stdizd = bmfmc.standardize_columns(data)
+
+    np.testing.assert_array_almost_equal(data_stdizd, expected_data_stdizd, decimal=12)
+    np.testing.assert_array_equal(data[:, 1], 2.0)
+
 
 def test_assemble_x_red_stdizd():
     """Test assembling and standardization of the dimension-reduced input."""
@@ -20,6 +20,7 @@ import numpy as np
 import pytest
 
 from queens.parameters.parameters import from_config_create_parameters
+from queens.parameters.random_fields.fourier import row_wise_kron
 
 
 @pytest.fixture(name="parameters", scope="module")
@@ -464,3 +465,16 @@ def test_from_config_create_parameters(parameters):
     sample_joint = np.concatenate((sample_1, sample_2, sample_3), axis=1)
     latent_grad = parameters.latent_grad(sample_joint)
     pytest.approx(latent_grad, np.concatenate((grad_field_1, grad_field_2, grad_field_3), axis=1))
+
+
+def test_row_wise_kron():
+    """Test the row-wise Kronecker product of the Fourier basis."""
+    rng = np.random.default_rng(1)
+    factors = [rng.random((4, 3)), rng.random((4, 2)), rng.random((4, 5))]
+
+    product = row_wise_kron(*factors)
+
+    expected_product = np.array(
+        [np.kron(np.kron(factors[0][i], factors[1][i]), factors[2][i]) for i in range(4)]
+    )
+    np.testing.assert_array_almost_equal(product, expected_product, decimal=12)
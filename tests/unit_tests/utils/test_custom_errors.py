@@ -46,3 +46,24 @@ def test_subprocess_raises_error():
     """Check if non existing command raises an SubprocessError."""
     with pytest.raises(SubprocessError):
         run_subprocess("NonExistingCommand")
+
+
+def test_subprocess_argument_list_raises_error():
+    """Check if a failing command passed as argument list raises an SubprocessError."""
+    with pytest.raises(SubprocessError, match="while executing the command:\nls /non/existing"):
+        run_subprocess(["ls", "/non/existing"])
+
+
+def test_subprocess_argument_list_missing_executable_warns(caplog):
+    """Check if a missing executable in an argument list only warns if requested."""
+    return_code, process_id, stdout, stderr = run_subprocess(
+        ["NonExistingCommand", "--version"], raise_error_on_subprocess_failure=False
+    )
+    assert return_code == 127
+    assert process_id is None
+    assert stdout == ""
+    assert "NonExistingCommand" in stderr
+    assert "while executing the command:\nNonExistingCommand --version" in caplog.text
+
+    with pytest.raises(SubprocessError, match="NonExistingCommand"):
+        run_subprocess(["NonExistingCommand"])
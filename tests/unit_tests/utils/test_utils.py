@@ -71,3 +71,14 @@ class TestPDFEstimation(unittest.TestCase):
 
         np.testing.assert_almost_equal(pdf_estimate[50], 0.40575231779015242, 7)
         np.testing.assert_almost_equal(supp_points[50], -0.36114748358535964, 7)
+
+    def test_density_estimation_fft(self):
+        """Test FFT-based density estimation against the direct kde."""
+        samples = np.random.randn(5000)
+        supp_points = np.linspace(-4, 4, 50)
+        pdf_estimate_fft, _ = estimate_pdf(
+            samples, self.bandwidth, support_points=supp_points, use_fft=True
+        )
+        pdf_estimate, _ = estimate_pdf(samples, self.bandwidth, support_points=supp_points)
+
+        np.testing.assert_allclose(pdf_estimate_fft, pdf_estimate, rtol=1e-3)